@@ -1,28 +1,93 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+from tkinter import font as tkfont
 import time
 from datetime import datetime, timedelta
 import json
+import hashlib
 import os
-import pandas as pd
+import csv
+import functools
+import operator
+import queue
+import threading
+import shutil
 import sys
+import logging
+
+# Diagnostics are silent unless GLM_DEBUG is set
+log = logging.getLogger("glm")
+log.addHandler(logging.NullHandler())
+if os.environ.get("GLM_DEBUG"):
+    logging.basicConfig(level=logging.DEBUG)
+
+# PyInstaller creates a temp folder and stores path in _MEIPASS
+BASE_PATH = getattr(sys, "_MEIPASS", None) or os.path.abspath(".")
 
 def get_resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller"""
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
-    
-    return os.path.join(base_path, relative_path)
+    return os.path.join(BASE_PATH, relative_path)
+
+def to_cents(amount):
+    """Convert a money amount to integer cents"""
+    return int(round(amount * 100))
+
+def format_money(cents):
+    """Format cents as whole currency units with thousands separators"""
+    return f"{cents // 100:,}"
+
+# Columns of the sessions database, in file order
+DB_COLUMNS = ['Date', 'Time', 'PlayStation', 'Customer', 'Duration_Hours',
+              'PS_Cost', 'Services', 'Service_Cost', 'Total_Cost']
+
+# Database file encoding: any customer name, and a BOM so Excel opens it as UTF-8
+DB_ENCODING = "utf-8-sig"
+
+# Values of a database record in column order (the csv module leaves every value a string)
+record_values = operator.itemgetter(*DB_COLUMNS)
+
+# Columns holding money amounts, exported to Excel as numbers
+DB_MONEY_COLUMNS = ('PS_Cost', 'Service_Cost', 'Total_Cost')
+
+# Maximum number of queued records written to the database in one go
+DB_WRITE_BATCH = 100
+
+# How often queued database writes are checked for failures, in ms
+DB_CHECK_MS = 200
+
+# Number of records added to the database viewer at a time
+DB_PAGE_SIZE = 200
+
+# How long status bar messages (and their Undo button) stay visible, in ms
+STATUS_TIMEOUT_MS = 5000
 
 class GamingLoungeManager:
+    # Database viewer (width, anchor, heading) per column; others use the default
+    _COL_CFG = {
+        'Date': (100, 'center', 'Date'),
+        'Time': (100, 'center', 'Time'),
+        'PlayStation': (80, 'center', 'PlayStation'),
+        'Duration_Hours': (100, 'center', 'Duration (HH:MM)'),
+        'PS_Cost': (80, 'center', 'PS Cost'),
+        'Service_Cost': (80, 'center', 'Service Cost'),
+        'Total_Cost': (80, 'center', 'Total Cost'),
+    }
+    
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("Gaming Lounge Manager")
         self.root.attributes('-zoomed', True)  # Cross-platform full screen
         
+        # Shared fonts, created once and used by every widget
+        self._font_normal_8 = tkfont.Font(family="Arial", size=8)
+        self._font_normal_10 = tkfont.Font(family="Arial", size=10)
+        self._font_bold_9 = tkfont.Font(family="Arial", size=9, weight="bold")
+        self._font_bold_10 = tkfont.Font(family="Arial", size=10, weight="bold")
+        self._font_bold_12 = tkfont.Font(family="Arial", size=12, weight="bold")
+        self._font_bold_14 = tkfont.Font(family="Arial", size=14, weight="bold")
+        self._font_bold_16 = tkfont.Font(family="Arial", size=16, weight="bold")
+        self._font_bold_20 = tkfont.Font(family="Arial", size=20, weight="bold")
+        
         # Configuration
         self.config = {
             "playstation_rate": 6000.0,  # per hour
@@ -36,6 +101,9 @@ class GamingLoungeManager:
                 "enabled": True,
                 "2_hour_rate": 5000.0,  # rate when 2+ hours
                 "3_hour_rate": 4666.0   # rate when 3+ hours
+            },
+            "ui": {
+                "confirm_service_add": False  # confirmation dialogs instead of quick add + undo
             }
         }
         
@@ -47,30 +115,280 @@ class GamingLoungeManager:
         
         # PlayStation sessions
         self.sessions = {
-            "PS1": {"active": False, "start_time": None, "customer_name": "", "services": []},
-            "PS2": {"active": False, "start_time": None, "customer_name": "", "services": []},
-            "PS3": {"active": False, "start_time": None, "customer_name": "", "services": []},
-            "PS4": {"active": False, "start_time": None, "customer_name": "", "services": []}
+            "PS1": {"active": False, "start_time": None, "customer_name": "", "services": [], "services_cents": 0},
+            "PS2": {"active": False, "start_time": None, "customer_name": "", "services": [], "services_cents": 0},
+            "PS3": {"active": False, "start_time": None, "customer_name": "", "services": [], "services_cents": 0},
+            "PS4": {"active": False, "start_time": None, "customer_name": "", "services": [], "services_cents": 0}
         }
         
-        # Database file
-        self.db_file = "gaming_lounge_db.xlsx"
+        # Timer loop state as parallel lists indexed by PlayStation position,
+        # kept in step with self.sessions by sync_session
+        self._ps_names = list(self.sessions)
+        self._ps_index = {ps_name: i for i, ps_name in enumerate(self._ps_names)}
+        self._active = [False] * len(self._ps_names)
+        self._start = [0.0] * len(self._ps_names)
+        self._svc_total = [0] * len(self._ps_names)
+        
+        # Last text shown on each PlayStation's timer and cost labels
+        self._last_timer_text = ["00:00:00"] * len(self._ps_names)
+        self._last_cost_text = ["Cost: $0"] * len(self._ps_names)
+        
+        # Rows currently shown in each PlayStation's services listbox
+        self._shown_services = {ps_name: [] for ps_name in self._ps_names}
+        
+        # Database file (append-only CSV, exported to Excel on demand)
+        self.db_file = "gaming_lounge_db.csv"
+        self.legacy_db_file = "gaming_lounge_db.xlsx"
         self.init_database()
         
+        # Today's date for the default database view, updated at midnight
+        self.update_today()
+        
         self.setup_ui()
-        self.update_timer()
+        
+        # Pending timer tick; the timer only runs while a session is active
+        self.timer_job = None
+        
+        # Close the database file on exit
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         
     def init_database(self):
-        """Initialize Excel database if it doesn't exist"""
+        """Initialize CSV database if it doesn't exist and open it for appending"""
         if not os.path.exists(self.db_file):
-            df = pd.DataFrame(columns=[
-                'Date', 'Time', 'PlayStation', 'Customer', 'Duration_Hours', 
-                'PS_Cost', 'Services', 'Service_Cost', 'Total_Cost'
-            ])
-            df.to_excel(self.db_file, index=False)
+            # Carry over records from the old Excel database, read before anything is written
+            legacy_rows = []
+            if os.path.exists(self.legacy_db_file):
+                try:
+                    legacy_rows = self.read_legacy_database()
+                except Exception as e:
+                    messagebox.showerror("Error", f"Failed to import {self.legacy_db_file}: {str(e)}\n\n"
+                                                  "Nothing was changed; the import is retried on the next start.")
+                    raise
+            
+            # Create the file in one step so a failed start leaves nothing behind
+            tmp_file = self.db_file + ".tmp"
+            with open(tmp_file, "w", newline="", encoding=DB_ENCODING) as f:
+                writer = csv.writer(f)
+                writer.writerow(DB_COLUMNS)
+                writer.writerows(legacy_rows)
+            os.replace(tmp_file, self.db_file)
+        
+        self.open_database()
+        
+        # Records kept in memory, re-read only when the file changes on disk
+        self._db_cache = None
+        self._db_mtime = None
+        self._db_by_date = {}
+        self._totals_by_date = {}
+        
+        # Records are written by a background thread so disk stalls don't freeze the UI
+        self._db_lock = threading.Lock()
+        self._db_queue = queue.Queue()
+        self._db_pending = 0
+        self._db_error = None
+        self._db_failed = []
+        self._db_check_job = None
+        self._db_thread = threading.Thread(target=self.database_worker, daemon=True)
+        self._db_thread.start()
+    
+    def read_legacy_database(self):
+        """Read the records of the old Excel database, in DB_COLUMNS order"""
+        # Rust-backed reader is much faster than openpyxl when installed
+        try:
+            from python_calamine import CalamineWorkbook
+            rows = CalamineWorkbook.from_path(self.legacy_db_file).get_sheet_by_index(0).to_python()
+        except ImportError:
+            from openpyxl import load_workbook
+            workbook = load_workbook(self.legacy_db_file, read_only=True, data_only=True)
+            rows = list(workbook.active.iter_rows(values_only=True))
+            workbook.close()
+        
+        if not rows:
+            return []
+        
+        # Match columns by header name; missing columns stay empty
+        positions = {name: i for i, name in enumerate(rows[0])}
+        indexes = [positions.get(col) for col in DB_COLUMNS]
+        return [["" if i is None or i >= len(row) or row[i] is None else row[i] for i in indexes]
+                for row in rows[1:]]
+    
+    def open_database(self):
+        """Open the database file in append mode, kept open for the session"""
+        self._db_fp = open(self.db_file, "a", newline="", encoding=DB_ENCODING)
+        self._db_writer = csv.DictWriter(self._db_fp, fieldnames=DB_COLUMNS)
+    
+    def append_to_database(self, row):
+        """Queue a single record to be appended to the database"""
+        # One record, as it would be read back, shared by the writer and the cache
+        record = {col: str(row[col]) for col in DB_COLUMNS}
+        with self._db_lock:
+            self._db_pending += 1
+        self._db_queue.put(record)
+        
+        # Watch for the write failing so it is reported as a failed save
+        if self._db_check_job is None:
+            self._db_check_job = self.root.after(DB_CHECK_MS, self.check_database_writes)
+        
+        if self._db_cache is not None:
+            self._db_cache.append(record)
+            self._db_by_date.setdefault(record['Date'], []).append((len(self._db_cache) - 1, record))
+            self.add_to_totals(record)
+    
+    def database_worker(self):
+        """Write queued records to the database in batches (background thread)"""
+        while True:
+            batch = [self._db_queue.get()]
+            
+            # Take whatever else is already waiting
+            while len(batch) < DB_WRITE_BATCH:
+                try:
+                    batch.append(self._db_queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            # None is the shutdown signal
+            rows = [row for row in batch if row is not None]
+            with self._db_lock:
+                try:
+                    self._db_writer.writerows(rows)
+                    self._db_fp.flush()
+                    # Our own writes are already in the cache
+                    self._db_mtime = os.fstat(self._db_fp.fileno()).st_mtime_ns
+                except Exception as e:
+                    # Reported on the UI thread by check_database_writes() or flush_database();
+                    # the records are kept so they can be saved again
+                    self._db_error = e
+                    self._db_failed.extend(rows)
+                    # The cache holds records that never reached the file
+                    self._db_mtime = None
+                self._db_pending -= len(rows)
+            
+            for _ in batch:
+                self._db_queue.task_done()
+            
+            if len(rows) < len(batch):
+                return
+    
+    def flush_database(self):
+        """Wait until all queued records are written to the database"""
+        self._db_queue.join()
+        
+        if self._db_error is not None:
+            error, self._db_error = self._db_error, None
+            raise error
+    
+    def check_database_writes(self):
+        """Report failed background writes as failed saves (polled on the UI thread)"""
+        with self._db_lock:
+            error, self._db_error = self._db_error, None
+            failed, self._db_failed = self._db_failed, []
+            pending = self._db_pending
+        
+        self._db_check_job = self.root.after(DB_CHECK_MS, self.check_database_writes) if pending else None
+        
+        if not failed:
+            return
+        
+        # The cache holds the failed records; read the file again instead
+        self._db_cache = None
+        
+        retry = messagebox.askretrycancel(
+            "Error", f"Failed to save to database: {str(error or 'write error')}\n\n"
+                     f"{self.describe_records(failed)}\n\nTry saving these records again?")
+        if retry:
+            for record in failed:
+                self.append_to_database(record)
+        
+        # Show the database as it is on disk
+        if hasattr(self, 'tree'):
+            self.refresh_database(silent=True)
+    
+    def describe_records(self, records):
+        """One line per record, for error messages about unsaved records"""
+        return "\n".join(f"{r['Date']} {r['Time']}  {r['PlayStation']}  {r['Customer']}  ${r['Total_Cost']}"
+                         for r in records)
+    
+    def load_database(self):
+        """Return all database records, reading the file only if it changed
+        
+        Doesn't wait for queued writes: those records are already in the cache.
+        """
+        with self._db_lock:
+            if self._db_cache is not None and self._db_pending:
+                return self._db_cache
+            pending = self._db_pending
+        
+        # Nothing cached yet to hold the queued records, so wait for them to reach the file
+        if pending:
+            self.flush_database()
+        
+        mtime = os.stat(self.db_file).st_mtime_ns
+        if self._db_cache is None or mtime != self._db_mtime:
+            with open(self.db_file, newline="", encoding=DB_ENCODING) as f:
+                self._db_cache = list(csv.DictReader(f))
+            self._db_mtime = mtime
+            self.index_database()
+        return self._db_cache
+    
+    def index_database(self):
+        """Group the cached records by date, with each record's row position, and total them"""
+        by_date = {}
+        self._totals_by_date = {}
+        for i, record in enumerate(self._db_cache):
+            by_date.setdefault(record['Date'], []).append((i, record))
+            self.add_to_totals(record)
+        self._db_by_date = by_date
+    
+    def add_to_totals(self, record):
+        """Add a record to its date's [total, PlayStation, services, sessions] totals"""
+        totals = self._totals_by_date.setdefault(record['Date'], [0.0, 0.0, 0.0, 0])
+        totals[0] += float(record['Total_Cost'] or 0)
+        totals[1] += float(record['PS_Cost'] or 0)
+        totals[2] += float(record['Service_Cost'] or 0)
+        totals[3] += 1
+    
+    def rewrite_database(self, records):
+        """Replace all database records (only needed when deleting)"""
+        with self._db_lock:
+            tmp_file = self.db_file + ".tmp"
+            with open(tmp_file, "w", newline="", encoding=DB_ENCODING) as f:
+                writer = csv.DictWriter(f, fieldnames=DB_COLUMNS)
+                writer.writeheader()
+                writer.writerows(records)
+            
+            # The append handle must be closed to replace the file on Windows;
+            # reopen it even if the replace fails so later saves keep working
+            self._db_fp.close()
+            try:
+                os.replace(tmp_file, self.db_file)
+            finally:
+                self.open_database()
+            
+            self._db_cache = records
+            self._db_mtime = os.stat(self.db_file).st_mtime_ns
+            self.index_database()
         
     def setup_ui(self):
         """Setup the main UI"""
+        # Keep the window hidden while widgets are created so layout runs once
+        self.root.withdraw()
+        
+        # PlayStation status colors, switched by style name
+        style = ttk.Style()
+        style.configure("Available.TLabel", foreground="green")
+        style.configure("InUse.TLabel", foreground="red")
+        
+        # Status bar for quick actions, with an Undo button
+        status_frame = ttk.Frame(self.root, padding=(10, 0, 10, 5))
+        status_frame.pack(side=tk.BOTTOM, fill=tk.X)
+        
+        self.status_label = ttk.Label(status_frame, text="")
+        self.status_label.pack(side=tk.LEFT)
+        
+        self.undo_btn = ttk.Button(status_frame, text="Undo", command=self.undo_last_action)
+        self.undo_action = None
+        self.status_job = None
+        
         # Create notebook for tabs
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -91,6 +409,10 @@ class GamingLoungeManager:
         self.setup_main_tab()
         self.setup_database_tab()
         self.setup_settings_tab()
+        
+        # Compute the layout of all tabs once, then show the window
+        self.root.update_idletasks()
+        self.root.deiconify()
 
     def setup_main_tab(self):
         """Setup the main PlayStation management tab"""
@@ -100,73 +422,28 @@ class GamingLoungeManager:
         
         # Title
         title_label = ttk.Label(main_frame, text="Gaming Lounge Manager", 
-                               font=("Arial", 20, "bold"))
+                               font=self._font_bold_20)
         title_label.grid(row=0, column=0, columnspan=4, pady=(0, 20))
         
         # Configure grid weights
         for i in range(4):
             main_frame.columnconfigure(i, weight=1)
         
+        # Service (name, price) pairs shared by every panel
+        services_items = tuple(self.config["services"].items())
+        
+        # Button text per service, shared by every panel's button for it
+        self._service_text_var = {service: tk.StringVar(value=f"{self.service_display[service]}\n${price}")
+                                  for service, price in services_items}
+        
         # PlayStation controls
         self.ps_frames = {}
         for i, ps_name in enumerate(["PS1", "PS2", "PS3", "PS4"]):
-            frame = ttk.LabelFrame(main_frame, text=ps_name, padding="10")
-            frame.grid(row=1, column=i, padx=5, pady=5, sticky=(tk.W, tk.E, tk.N, tk.S))
-            
-            # Status label
-            status_label = ttk.Label(frame, text="Available", foreground="green")
-            status_label.grid(row=0, column=0, pady=5, columnspan=2)
-            
-            # Timer label
-            timer_label = ttk.Label(frame, text="00:00:00", font=("Arial", 12, "bold"))
-            timer_label.grid(row=1, column=0, pady=5, columnspan=2)
-            
-            # Current cost label
-            cost_label = ttk.Label(frame, text="Cost: $0", font=("Arial", 10, "bold"), foreground="blue")
-            cost_label.grid(row=2, column=0, pady=5, columnspan=2)
-            
-            # Apply button
-            apply_btn = ttk.Button(frame, text="Apply", 
-                                 command=lambda ps=ps_name: self.start_session(ps))
-            apply_btn.grid(row=3, column=0, pady=5, sticky=(tk.W, tk.E))
-            
-            # Done button
-            done_btn = ttk.Button(frame, text="Done", 
-                                command=lambda ps=ps_name: self.end_session(ps))
-            done_btn.grid(row=3, column=1, pady=5, sticky=(tk.W, tk.E))
-            
-            # Services section for this PS
-            services_label = ttk.Label(frame, text="Services:", font=("Arial", 10, "bold"))
-            services_label.grid(row=4, column=0, columnspan=2, pady=(10, 5), sticky=tk.W)
-            
-            # Service buttons
-            service_buttons = {}
-            for j, (service, price) in enumerate(self.config["services"].items()):
-                btn = ttk.Button(frame, text=f"{service.title()}\n${price}", 
-                               command=lambda ps=ps_name, srv=service: self.add_service(ps, srv))
-                btn.grid(row=5 + j//2, column=j%2, pady=2, padx=2, sticky=(tk.W, tk.E))
-                service_buttons[service] = btn
-            
-            # Services list
-            services_listbox = tk.Listbox(frame, height=3, font=("Arial", 8))
-            services_listbox.grid(row=7, column=0, columnspan=2, pady=5, sticky=(tk.W, tk.E))
-            
-            # Remove service button
-            remove_service_btn = ttk.Button(frame, text="Remove Selected", 
-                                          command=lambda ps=ps_name: self.remove_service(ps))
-            remove_service_btn.grid(row=8, column=0, columnspan=2, pady=2, sticky=(tk.W, tk.E))
-            
-            self.ps_frames[ps_name] = {
-                "frame": frame,
-                "status_label": status_label,
-                "timer_label": timer_label,
-                "cost_label": cost_label,
-                "apply_btn": apply_btn,
-                "done_btn": done_btn,
-                "service_buttons": service_buttons,
-                "services_listbox": services_listbox,
-                "remove_service_btn": remove_service_btn
-            }
+            self.ps_frames[ps_name] = self.build_ps_panel(main_frame, ps_name, i, services_items)
+        
+        # Timer and cost labels in PlayStation order for the timer loop
+        self._timer_labels = [self.ps_frames[ps_name]["timer_label"] for ps_name in self._ps_names]
+        self._cost_labels = [self.ps_frames[ps_name]["cost_label"] for ps_name in self._ps_names]
 
         # Services Only section
         services_only_frame = ttk.LabelFrame(main_frame, text="Services Only", padding="10")
@@ -174,7 +451,7 @@ class GamingLoungeManager:
         
         # Services Only label
         services_label = ttk.Label(services_only_frame, text="No PlayStation", 
-                                  foreground="blue", font=("Arial", 10, "bold"))
+                                  foreground="blue", font=self._font_bold_10)
         services_label.grid(row=0, column=0, columnspan=2, pady=5)
         
         # Customer name entry
@@ -184,13 +461,13 @@ class GamingLoungeManager:
         customer_entry.grid(row=1, column=1, pady=2, sticky=(tk.W, tk.E))
         
         # Services section
-        services_label = ttk.Label(services_only_frame, text="Services:", font=("Arial", 10, "bold"))
+        services_label = ttk.Label(services_only_frame, text="Services:", font=self._font_bold_10)
         services_label.grid(row=2, column=0, columnspan=2, pady=(10, 5), sticky=tk.W)
         
         # Service buttons for services only
         self.services_only_buttons = {}
-        for j, (service, price) in enumerate(self.config["services"].items()):
-            btn = ttk.Button(services_only_frame, text=f"{service.title()}\n${price}", 
+        for j, (service, price) in enumerate(services_items):
+            btn = ttk.Button(services_only_frame, textvariable=self._service_text_var[service], 
                            command=lambda srv=service: self.add_service_only(srv))
             btn.grid(row=3 + j//2, column=j%2, pady=2, padx=2, sticky=(tk.W, tk.E))
             self.services_only_buttons[service] = btn
@@ -201,10 +478,10 @@ class GamingLoungeManager:
         add_pending_btn.grid(row=6, column=0, columnspan=2, pady=10, sticky=(tk.W, tk.E))
         
         # Current order display
-        current_order_label = ttk.Label(services_only_frame, text="Current Order:", font=("Arial", 9, "bold"))
+        current_order_label = ttk.Label(services_only_frame, text="Current Order:", font=self._font_bold_9)
         current_order_label.grid(row=7, column=0, columnspan=2, pady=(10, 5), sticky=tk.W)
         
-        self.current_order_listbox = tk.Listbox(services_only_frame, height=3, font=("Arial", 8))
+        self.current_order_listbox = tk.Listbox(services_only_frame, height=3, font=self._font_normal_8)
         self.current_order_listbox.grid(row=8, column=0, columnspan=2, pady=5, sticky=(tk.W, tk.E))
         
         # Remove service button
@@ -254,7 +531,69 @@ class GamingLoungeManager:
         
         # Initialize data structures
         self.services_only_list = []
+        self.services_only_total = 0.0
         self.pending_orders = []
+        self.pending_iid_counter = 0
+
+    def build_ps_panel(self, parent, ps_name, column, services_items):
+        """Build the controls of one PlayStation and return its widgets"""
+        frame = ttk.LabelFrame(parent, text=ps_name, padding="10")
+        frame.grid(row=1, column=column, padx=5, pady=5, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        # Status label
+        status_label = ttk.Label(frame, text="Available", style="Available.TLabel")
+        status_label.grid(row=0, column=0, pady=5, columnspan=2)
+        
+        # Timer label
+        timer_label = ttk.Label(frame, text="00:00:00", font=self._font_bold_12)
+        timer_label.grid(row=1, column=0, pady=5, columnspan=2)
+        
+        # Current cost label
+        cost_label = ttk.Label(frame, text="Cost: $0", font=self._font_bold_10, foreground="blue")
+        cost_label.grid(row=2, column=0, pady=5, columnspan=2)
+        
+        # Apply button
+        apply_btn = ttk.Button(frame, text="Apply", 
+                             command=lambda ps=ps_name: self.start_session(ps))
+        apply_btn.grid(row=3, column=0, pady=5, sticky=(tk.W, tk.E))
+        
+        # Done button
+        done_btn = ttk.Button(frame, text="Done", 
+                            command=lambda ps=ps_name: self.end_session(ps))
+        done_btn.grid(row=3, column=1, pady=5, sticky=(tk.W, tk.E))
+        
+        # Services section for this PS
+        services_label = ttk.Label(frame, text="Services:", font=self._font_bold_10)
+        services_label.grid(row=4, column=0, columnspan=2, pady=(10, 5), sticky=tk.W)
+        
+        # Service buttons
+        service_buttons = {}
+        for j, (service, price) in enumerate(services_items):
+            btn = ttk.Button(frame, textvariable=self._service_text_var[service], 
+                           command=lambda ps=ps_name, srv=service: self.add_service(ps, srv))
+            btn.grid(row=5 + j//2, column=j%2, pady=2, padx=2, sticky=(tk.W, tk.E))
+            service_buttons[service] = btn
+        
+        # Services list
+        services_listbox = tk.Listbox(frame, height=3, font=self._font_normal_8)
+        services_listbox.grid(row=7, column=0, columnspan=2, pady=5, sticky=(tk.W, tk.E))
+        
+        # Remove service button
+        remove_service_btn = ttk.Button(frame, text="Remove Selected", 
+                                      command=lambda ps=ps_name: self.remove_service(ps))
+        remove_service_btn.grid(row=8, column=0, columnspan=2, pady=2, sticky=(tk.W, tk.E))
+        
+        return {
+            "frame": frame,
+            "status_label": status_label,
+            "timer_label": timer_label,
+            "cost_label": cost_label,
+            "apply_btn": apply_btn,
+            "done_btn": done_btn,
+            "service_buttons": service_buttons,
+            "services_listbox": services_listbox,
+            "remove_service_btn": remove_service_btn
+        }
 
     def setup_settings_tab(self):
         # Settings frame
@@ -263,7 +602,7 @@ class GamingLoungeManager:
         
         # Title
         title_label = ttk.Label(settings_frame, text="Price Configuration", 
-                               font=("Arial", 16, "bold"))
+                               font=self._font_bold_16)
         title_label.pack(pady=(0, 20))
         
         # PlayStation rate section
@@ -281,7 +620,7 @@ class GamingLoungeManager:
         
         self.service_vars = {}
         for i, (service, price) in enumerate(self.config["services"].items()):
-            ttk.Label(services_frame, text=f"{service.title()} ($):").grid(row=i, column=0, sticky=tk.W, padx=(0, 10), pady=2)
+            ttk.Label(services_frame, text=f"{self.service_display[service]} ($):").grid(row=i, column=0, sticky=tk.W, padx=(0, 10), pady=2)
             var = tk.StringVar(value=str(price))
             entry = ttk.Entry(services_frame, textvariable=var, width=10)
             entry.grid(row=i, column=1, sticky=tk.W, pady=2)
@@ -309,6 +648,15 @@ class GamingLoungeManager:
         offer_3h_entry = ttk.Entry(offers_frame, textvariable=self.offer_3h_var, width=10)
         offer_3h_entry.grid(row=2, column=1, sticky=tk.W, pady=2)
         
+        # Interface section
+        ui_frame = ttk.LabelFrame(settings_frame, text="Interface", padding="10")
+        ui_frame.pack(fill=tk.X, pady=(0, 20))
+        
+        self.confirm_service_add_var = tk.BooleanVar(value=self.config["ui"]["confirm_service_add"])
+        confirm_checkbox = ttk.Checkbutton(ui_frame, text="Ask for confirmation when starting or ending sessions and adding, removing or clearing services", 
+                                          variable=self.confirm_service_add_var)
+        confirm_checkbox.grid(row=0, column=0, sticky=tk.W)
+        
         # Buttons
         button_frame = ttk.Frame(settings_frame)
         button_frame.pack(pady=20)
@@ -341,9 +689,13 @@ class GamingLoungeManager:
             self.config["offers"]["2_hour_rate"] = float(self.offer_2h_var.get())
             self.config["offers"]["3_hour_rate"] = float(self.offer_3h_var.get())
             
+            # Update interface options
+            self.config["ui"]["confirm_service_add"] = self.confirm_service_add_var.get()
+            
+            self.update_config_cache()
+            
             # Save to config file
-            with open(self.config_file, "w") as f:
-                json.dump(self.config, f, indent=4)
+            self.write_config()
             
             # Update service buttons in main tab
             self.update_service_buttons()
@@ -369,12 +721,16 @@ class GamingLoungeManager:
                 "enabled": True,
                 "2_hour_rate": 5000.0,
                 "3_hour_rate": 4666.0
+            },
+            "ui": {
+                "confirm_service_add": False
             }
         }
         
         result = messagebox.askyesno("Confirm Reset", "Reset all prices to default values?")
         if result:
             self.config = default_config.copy()
+            self.update_config_cache()
             
             # Update UI
             self.ps_rate_var.set(str(self.config["playstation_rate"]))
@@ -386,6 +742,9 @@ class GamingLoungeManager:
             self.offer_2h_var.set(str(self.config["offers"]["2_hour_rate"]))
             self.offer_3h_var.set(str(self.config["offers"]["3_hour_rate"]))
             
+            # Update interface UI
+            self.confirm_service_add_var.set(self.config["ui"]["confirm_service_add"])
+            
             self.update_service_buttons()
             messagebox.showinfo("Success", "Settings reset to default values!")
 
@@ -419,6 +778,13 @@ class GamingLoungeManager:
                         self.config["offers"]["3_hour_rate"] = loaded_config["offers"]["3_hour_rate"]
                         self.offer_3h_var.set(str(self.config["offers"]["3_hour_rate"]))
                 
+                # Update interface options
+                if "ui" in loaded_config:
+                    if "confirm_service_add" in loaded_config["ui"]:
+                        self.config["ui"]["confirm_service_add"] = loaded_config["ui"]["confirm_service_add"]
+                        self.confirm_service_add_var.set(self.config["ui"]["confirm_service_add"])
+                
+                self.update_config_cache()
                 self.update_service_buttons()
                 messagebox.showinfo("Success", "Settings loaded from config.json!")
             else:
@@ -429,28 +795,62 @@ class GamingLoungeManager:
 
     def update_service_buttons(self):
         """Update service button texts with new prices"""
-        for ps_name, ps_frame in self.ps_frames.items():
-            for service, button in ps_frame["service_buttons"].items():
-                price = self.config["services"][service]
-                button.config(text=f"{service.title()}\n${price}")
-        
-        # Update services-only buttons
-        if hasattr(self, 'services_only_buttons'):
-            for service, button in self.services_only_buttons.items():
-                price = self.config["services"][service]
-                button.config(text=f"{service.title()}\n${price}")
+        for service, text_var in self._service_text_var.items():
+            price = self.config["services"][service]
+            text_var.set(f"{self.service_display[service]}\n${price}")
 
     def load_config(self):
         """Load configuration from file"""
+        self._last_config_hash = None
         try:
             if os.path.exists(self.config_file):
-                with open(self.config_file, "r") as f:
-                    loaded_config = json.load(f)
+                with open(self.config_file, "rb") as f:
+                    payload = f.read()
+                loaded_config = json.loads(payload)
+                self._last_config_hash = hashlib.blake2b(payload, digest_size=16).digest()
                 # Update config with loaded values
                 self.config.update(loaded_config)
-        except Exception as e:
-            print(f"Could not load config: {e}")
+        except Exception:
+            log.debug("Could not load config", exc_info=True)
             # Use default config
+        
+        self.update_config_cache()
+
+    def write_config(self):
+        """Write configuration to file, skipping the write if nothing changed"""
+        payload = json.dumps(self.config, indent=4).encode()
+        config_hash = hashlib.blake2b(payload, digest_size=16).digest()
+        if config_hash == self._last_config_hash:
+            return
+        
+        # Write a temp file and swap it in so a crash can't leave a broken config
+        tmp_file = self.config_file + ".tmp"
+        with open(tmp_file, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_file, self.config_file)
+        self._last_config_hash = config_hash
+
+    def update_config_cache(self):
+        """Recompute values derived from the configuration"""
+        # Display names of services
+        self.service_display = {service: service.title() for service in self.config["services"]}
+        
+        # Prices in integer cents, used for all cost arithmetic
+        offers = self.config["offers"]
+        self.cents = {
+            "playstation_rate": to_cents(self.config["playstation_rate"]),
+            "2_hour_rate": to_cents(offers["2_hour_rate"]),
+            "3_hour_rate": to_cents(offers["3_hour_rate"]),
+            "services": {service: to_cents(price) for service, price in self.config["services"].items()}
+        }
+        
+        # (minimum seconds, hourly rate) tiers, longest first; also the cache key for live costs
+        if offers["enabled"]:
+            self.rate_tiers = ((3 * 3600, self.cents["3_hour_rate"]),
+                               (2 * 3600, self.cents["2_hour_rate"]),
+                               (0, self.cents["playstation_rate"]))
+        else:
+            self.rate_tiers = ((0, self.cents["playstation_rate"]),)
 
     def add_service(self, ps_name, service):
         """Add service to PlayStation with confirmation"""
@@ -458,20 +858,46 @@ class GamingLoungeManager:
             messagebox.showwarning("Warning", f"{ps_name} is not active. Start a session first.")
             return
             
+        price = self.config["services"][service]
+        confirm = self.config["ui"]["confirm_service_add"]
+        
         # Show confirmation dialog
-        result = messagebox.askyesno("Confirm Service", 
-                                   f"Add {service.title()} (${self.config['services'][service]}) to {ps_name}?")
+        if confirm:
+            result = messagebox.askyesno("Confirm Service", 
+                                       f"Add {self.service_display[service]} (${price}) to {ps_name}?")
+            if not result:
+                return
         
-        if result:
-            service_entry = {
-                "name": service,
-                "price": self.config["services"][service],
-                "time": datetime.now().strftime("%H:%M:%S")
-            }
-            
-            self.sessions[ps_name]["services"].append(service_entry)
-            self.update_services_display(ps_name)
-            messagebox.showinfo("Success", f"{service.title()} added to {ps_name}")
+        service_entry = {
+            "name": service,
+            "price": price,
+            "time": datetime.now().strftime("%H:%M:%S")
+        }
+        
+        session = self.sessions[ps_name]
+        session["services"].append(service_entry)
+        session["services_cents"] += self.cents["services"][service]
+        self.sync_session(ps_name)
+        self.update_services_display(ps_name)
+        
+        message = f"{self.service_display[service]} added to {ps_name}"
+        if confirm:
+            messagebox.showinfo("Success", message)
+        else:
+            self.show_status(message, undo=lambda: self.undo_add_service(ps_name, session, service_entry))
+    
+    def undo_add_service(self, ps_name, session, service_entry):
+        """Take back a service added in quick add mode"""
+        if self.sessions[ps_name] is not session or self.refuse_undo_while_billed(ps_name):
+            return
+        
+        for index, entry in enumerate(session["services"]):
+            if entry is service_entry:
+                del session["services"][index]
+                session["services_cents"] -= to_cents(service_entry["price"])
+                self.sync_session(ps_name)
+                self.update_services_display(ps_name)
+                break
     
     def remove_service(self, ps_name):
         """Remove selected service from PlayStation"""
@@ -485,27 +911,71 @@ class GamingLoungeManager:
         index = selection[0]
         service_name = self.sessions[ps_name]["services"][index]["name"]
         
-        result = messagebox.askyesno("Confirm Removal", 
-                                   f"Remove {service_name.title()} from {ps_name}?")
+        confirm = self.config["ui"]["confirm_service_add"]
+        if confirm:
+            result = messagebox.askyesno("Confirm Removal", 
+                                       f"Remove {self.service_display[service_name]} from {ps_name}?")
+            if not result:
+                return
         
-        if result:
-            del self.sessions[ps_name]["services"][index]
-            self.update_services_display(ps_name)
+        session = self.sessions[ps_name]
+        service_entry = session["services"].pop(index)
+        session["services_cents"] -= to_cents(service_entry["price"])
+        self.sync_session(ps_name)
+        self.update_services_display(ps_name)
+        
+        if not confirm:
+            self.show_status(f"{self.service_display[service_name]} removed from {ps_name}",
+                             undo=lambda: self.undo_remove_service(ps_name, session, index, service_entry))
+    
+    def undo_remove_service(self, ps_name, session, index, service_entry):
+        """Put back a service removed in quick add mode"""
+        if self.sessions[ps_name] is not session or self.refuse_undo_while_billed(ps_name):
+            return
+        
+        session["services"].insert(index, service_entry)
+        session["services_cents"] += to_cents(service_entry["price"])
+        self.sync_session(ps_name)
+        self.update_services_display(ps_name)
+    
+    def sync_session(self, ps_name):
+        """Copy a session's timer loop fields into the parallel lists"""
+        session = self.sessions[ps_name]
+        i = self._ps_index[ps_name]
+        self._active[i] = session["active"]
+        self._start[i] = session["start_time"] or 0.0
+        self._svc_total[i] = session["services_cents"]
     
     def update_services_display(self, ps_name):
         """Update the services listbox display"""
         listbox = self.ps_frames[ps_name]["services_listbox"]
-        listbox.delete(0, tk.END)
         
-        for service in self.sessions[ps_name]["services"]:
-            display_text = f"{service['name'].title()} - ${service['price']} ({service['time']})"
-            listbox.insert(tk.END, display_text)
+        fmt = "{} - ${} ({})".format
+        display = self.service_display
+        new = [fmt(display[service['name']], service['price'], service['time'])
+               for service in self.sessions[ps_name]["services"]]
+        old = self._shown_services[ps_name]
+        
+        # Only touch the rows that changed
+        for i in range(max(len(new), len(old))):
+            if i >= len(new):
+                listbox.delete(i, tk.END)
+                break
+            elif i >= len(old):
+                listbox.insert(tk.END, new[i])
+            elif new[i] != old[i]:
+                listbox.delete(i)
+                listbox.insert(i, new[i])
+        
+        self._shown_services[ps_name] = new
 
     def start_session(self, ps_name):
         # Confirmation dialog
-        result = messagebox.askyesno("Confirm Start", f"Start gaming session on {ps_name}?")
-        if not result:
-            return
+        confirm = self.config["ui"]["confirm_service_add"]
+        if confirm:
+            result = messagebox.askyesno("Confirm Start", f"Start gaming session on {ps_name}?")
+            if not result:
+                return
         
         if self.sessions[ps_name]["active"]:
             messagebox.showwarning("Warning", f"{ps_name} is already in use")
@@ -515,19 +985,41 @@ class GamingLoungeManager:
             "active": True,
             "start_time": time.time(),
             "customer_name": "",
-            "services": []
+            "services": [],
+            "services_cents": 0
         }
+        self.sync_session(ps_name)
+        if self.timer_job is None:
+            self.update_timer()
         
-        self.ps_frames[ps_name]["status_label"].config(text="In Use", foreground="red")
+        self.ps_frames[ps_name]["status_label"].configure(style="InUse.TLabel", text="In Use")
         self.ps_frames[ps_name]["apply_btn"].config(state="disabled")
         
-        messagebox.showinfo("Success", f"{ps_name} started")
+        if confirm:
+            messagebox.showinfo("Success", f"{ps_name} started")
+        else:
+            session = self.sessions[ps_name]
+            self.show_status(f"{ps_name} started", undo=lambda: self.undo_start_session(ps_name, session))
+    
+    def undo_start_session(self, ps_name, session):
+        """Cancel a session started in quick add mode"""
+        if self.sessions[ps_name] is session and not self.refuse_undo_while_billed(ps_name):
+            self.reset_session(ps_name)
+    
+    def refuse_undo_while_billed(self, ps_name):
+        """Block undoing changes to a session whose bill is open, as the bill would go stale"""
+        if (hasattr(self, 'bill_window') and self.bill_ps_name == ps_name
+                and self.bill_window.state() != "withdrawn"):
+            self.show_status(f"{ps_name} has an open bill; close it before undoing")
+            return True
+        return False
 
     def end_session(self, ps_name):
-        # Confirmation dialog
-        result = messagebox.askyesno("Confirm End", f"End gaming session on {ps_name}?")
-        if not result:
-            return
+        # Confirmation dialog (the bill window itself confirms in quick add mode)
+        if self.config["ui"]["confirm_service_add"]:
+            result = messagebox.askyesno("Confirm End", f"End gaming session on {ps_name}?")
+            if not result:
+                return
         
         if not self.sessions[ps_name]["active"]:
             messagebox.showwarning("Warning", f"{ps_name} is not in use")
@@ -535,84 +1027,154 @@ class GamingLoungeManager:
         
         # Calculate duration and cost with offers
         duration = time.time() - self.sessions[ps_name]["start_time"]
-        hours = duration / 3600
-        ps_cost = self.calculate_ps_cost(hours)
+        ps_cost = self.calculate_ps_cost(duration)
         
         # Calculate services cost
-        service_cost = sum(service["price"] for service in self.sessions[ps_name]["services"])
+        service_cost = self.sessions[ps_name]["services_cents"]
         total_cost = ps_cost + service_cost
         
         # Show bill
         self.show_bill(ps_name, duration, ps_cost, service_cost, total_cost)
     
-    def show_bill(self, ps_name, duration, ps_cost, service_cost, total_cost):
-        bill_window = tk.Toplevel(self.root)
-        bill_window.title("Bill")
-        bill_window.geometry("400x700")
+    def build_bill_window(self):
+        """Create the bill window once; show_bill refills and reshows it"""
+        self.bill_window = tk.Toplevel(self.root)
+        self.bill_window.title("Bill")
+        self.bill_window.geometry("400x700")
+        self.bill_window.protocol("WM_DELETE_WINDOW", self.bill_window.withdraw)
         
         # Bill content
-        bill_frame = ttk.Frame(bill_window, padding="20")
+        bill_frame = ttk.Frame(self.bill_window, padding="20")
         bill_frame.pack(fill=tk.BOTH, expand=True)
         
-        ttk.Label(bill_frame, text="GAMING LOUNGE BILL", 
-                 font=("Arial", 16, "bold")).pack(pady=(0, 20))
+        # Bill body
+        self.bill_text = tk.Text(bill_frame, width=48, font=self._font_normal_10, relief="flat",
+                                 borderwidth=0, wrap="word",
+                                 background=self.bill_window.cget("background"))
+        self.bill_text.tag_configure("title", font=self._font_bold_16, justify="center")
+        self.bill_text.tag_configure("heading", font=self._font_bold_12)
+        self.bill_text.tag_configure("offer", font=self._font_bold_10, foreground="green")
+        self.bill_text.tag_configure("savings", font=self._font_bold_10, foreground="red")
+        self.bill_text.tag_configure("separator", foreground="gray")
+        self.bill_text.pack(fill=tk.BOTH, expand=True)
+        
+        # Font of each tag, to size the body from the lines it holds
+        self.bill_tag_fonts = {"title": self._font_bold_16, "heading": self._font_bold_12,
+                               "offer": self._font_bold_10, "savings": self._font_bold_10}
+        
+        # Offer selection (only shown when an offer applies)
+        self.apply_offer_var = tk.BooleanVar(value=False)
+        self.bill_offer_checkbox = ttk.Checkbutton(bill_frame, variable=self.apply_offer_var,
+                                                   command=self.update_bill_total)
+        
+        self.bill_separator = ttk.Separator(bill_frame, orient='horizontal')
+        self.bill_separator.pack(fill=tk.X, pady=10)
         
-        ttk.Label(bill_frame, text=f"PlayStation: {ps_name}").pack(anchor=tk.W)
-        ttk.Label(bill_frame, text=f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M')}").pack(anchor=tk.W)
+        # Total section (will be updated dynamically)
+        self.bill_total_frame = ttk.Frame(bill_frame)
+        self.bill_total_frame.pack(anchor=tk.W)
         
-        ttk.Separator(bill_frame, orient='horizontal').pack(fill=tk.X, pady=10)
+        self.bill_ps_label = ttk.Label(self.bill_total_frame, font=self._font_bold_12)
+        self.bill_ps_label.pack(anchor=tk.W)
+        # Savings label is only packed while savings apply
+        self.bill_savings_label = ttk.Label(self.bill_total_frame, font=self._font_normal_10, foreground="red")
+        self.bill_total_label = ttk.Label(self.bill_total_frame, font=self._font_bold_14)
+        self.bill_total_label.pack(anchor=tk.W, pady=(10, 0))
+        
+        # Buttons act on the session currently shown
+        button_frame = ttk.Frame(bill_frame)
+        button_frame.pack(pady=20)
+        
+        ttk.Button(button_frame, text="Save to Database", 
+                  command=lambda: self.save_bill_to_database(self.bill_ps_name, self.bill_duration,
+                                                             self.bill_service_cost, self.bill_window)).pack(side=tk.LEFT, padx=5)
+        
+        ttk.Button(button_frame, text="Close Without Saving", 
+                  command=lambda: self.close_session(self.bill_ps_name, self.bill_window)).pack(side=tk.LEFT, padx=5)
+
+    def show_bill(self, ps_name, duration, ps_cost, service_cost, total_cost):
+        if not hasattr(self, 'bill_window'):
+            self.build_bill_window()
+        
+        self.bill_ps_name = ps_name
+        self.bill_duration = duration
+        self.bill_service_cost = service_cost
         
         # Duration in HH:MM format
         hours = int(duration // 3600)
         minutes = int((duration % 3600) // 60)
         duration_str = f"{hours:02d}:{minutes:02d}"
-        duration_hours = duration / 3600
-        
-        ttk.Label(bill_frame, text=f"Duration: {duration_str}").pack(anchor=tk.W)
-        ttk.Label(bill_frame, text=f"Base Rate: ${int(self.config['playstation_rate']):,}/hour").pack(anchor=tk.W)
+        seconds = int(duration)
+        base_rate = self.cents["playstation_rate"]
         
         # Calculate normal cost (without offers)
-        normal_ps_cost = duration_hours * self.config["playstation_rate"]
-        ttk.Label(bill_frame, text=f"Normal PlayStation Cost: ${int(normal_ps_cost):,}").pack(anchor=tk.W)
+        normal_ps_cost = seconds * base_rate // 3600
         
         # Check for offer eligibility
         offer_applied = False
         offer_savings = 0
         
-        if duration_hours >= 3:
-            offer_rate = self.config["offers"]["3_hour_rate"]
-            offer_ps_cost = duration_hours * offer_rate
+        if seconds >= 3 * 3600:
+            offer_rate = self.cents["3_hour_rate"]
+            offer_ps_cost = seconds * offer_rate // 3600
             offer_savings = normal_ps_cost - offer_ps_cost
             offer_text = "3+ Hour Offer"
             offer_applied = True
-        elif duration_hours >= 2:
-            offer_rate = self.config["offers"]["2_hour_rate"]
-            offer_ps_cost = duration_hours * offer_rate
+        elif seconds >= 2 * 3600:
+            offer_rate = self.cents["2_hour_rate"]
+            offer_ps_cost = seconds * offer_rate // 3600
             offer_savings = normal_ps_cost - offer_ps_cost
             offer_text = "2+ Hour Offer"
             offer_applied = True
         
+        # Bill body as alternating (text, tag) pieces for a single Text widget
+        separator = "─" * 40 + "\n"
+        parts = [
+            "GAMING LOUNGE BILL\n\n", "title",
+            f"PlayStation: {ps_name}\n", "",
+            f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n", "",
+            separator, "separator",
+            f"Duration: {duration_str}\n", "",
+            f"Base Rate: ${format_money(base_rate)}/hour\n", "",
+            f"Normal PlayStation Cost: ${format_money(normal_ps_cost)}\n", "",
+        ]
+        
         # Show offer section if eligible
         if offer_applied:
-            ttk.Separator(bill_frame, orient='horizontal').pack(fill=tk.X, pady=10)
-            
-            # Offer eligibility frame
-            offer_frame = ttk.LabelFrame(bill_frame, text=f"🎉 {offer_text} Available!", padding="10")
-            offer_frame.pack(fill=tk.X, pady=5)
-            
-            ttk.Label(offer_frame, text=f"Offer Rate: ${int(offer_rate):,}/hour", 
-                     font=("Arial", 10, "bold"), foreground="green").pack(anchor=tk.W)
-            ttk.Label(offer_frame, text=f"With Offer: ${int(offer_ps_cost):,}", 
-                     font=("Arial", 10, "bold"), foreground="green").pack(anchor=tk.W)
-            ttk.Label(offer_frame, text=f"You Save: ${int(offer_savings):,}", 
-                     font=("Arial", 10, "bold"), foreground="red").pack(anchor=tk.W)
-            
+            parts += [
+                separator, "separator",
+                f"🎉 {offer_text} Available!\n", "heading",
+                f"Offer Rate: ${format_money(offer_rate)}/hour\n", "offer",
+                f"With Offer: ${format_money(offer_ps_cost)}\n", "offer",
+                f"You Save: ${format_money(offer_savings)}\n", "savings",
+            ]
+        
+        parts += [separator, "separator", "Services Used:\n", "heading"]
+        
+        # Services
+        if self.sessions[ps_name]["services"]:
+            for service in self.sessions[ps_name]["services"]:
+                parts += [f"• {self.service_display[service['name']]}: ${int(service['price']):,} ({service['time']})\n", ""]
+        else:
+            parts += ["No additional services\n", ""]
+        
+        parts += [f"Services Total: ${format_money(service_cost)}\n", ""]
+        
+        # Text height counts lines of the widget font, so convert the larger tagged lines
+        pixels = sum(text.count("\n") * self.bill_tag_fonts.get(tag, self._font_normal_10).metrics("linespace")
+                     for text, tag in zip(parts[::2], parts[1::2]))
+        height = -(-pixels // self._font_normal_10.metrics("linespace"))
+        
+        self.bill_text.config(state="normal", height=height)
+        self.bill_text.delete("1.0", tk.END)
+        self.bill_text.insert("1.0", *parts)
+        self.bill_text.config(state="disabled")
+        
+        if offer_applied:
             # Offer selection
-            self.apply_offer_var = tk.BooleanVar(value=True)
-            offer_checkbox = ttk.Checkbutton(offer_frame, text=f"Apply {offer_text}", 
-                                            variable=self.apply_offer_var,
-                                            command=lambda: self.update_bill_total(bill_frame, duration_hours, service_cost))
-            offer_checkbox.pack(anchor=tk.W, pady=5)
+            self.apply_offer_var.set(True)
+            self.bill_offer_checkbox.config(text=f"Apply {offer_text}")
+            self.bill_offer_checkbox.pack(anchor=tk.W, pady=5, before=self.bill_separator)
             
             # Store offer details for calculation
             self.current_offer = {
@@ -621,69 +1183,42 @@ class GamingLoungeManager:
                 "savings": offer_savings
             }
         else:
-            self.apply_offer_var = tk.BooleanVar(value=False)
+            self.apply_offer_var.set(False)
+            self.bill_offer_checkbox.pack_forget()
             self.current_offer = {"normal_cost": normal_ps_cost, "offer_cost": normal_ps_cost, "savings": 0}
         
-        ttk.Separator(bill_frame, orient='horizontal').pack(fill=tk.X, pady=10)
-        
-        # Services
-        ttk.Label(bill_frame, text="Services Used:", font=("Arial", 12, "bold")).pack(anchor=tk.W)
-        
-        if self.sessions[ps_name]["services"]:
-            for service in self.sessions[ps_name]["services"]:
-                ttk.Label(bill_frame, text=f"• {service['name'].title()}: ${int(service['price']):,} ({service['time']})").pack(anchor=tk.W)
-        else:
-            ttk.Label(bill_frame, text="No additional services").pack(anchor=tk.W)
-        
-        ttk.Label(bill_frame, text=f"Services Total: ${int(service_cost):,}").pack(anchor=tk.W, pady=(5, 0))
-        
-        ttk.Separator(bill_frame, orient='horizontal').pack(fill=tk.X, pady=10)
-        
-        # Total section (will be updated dynamically)
-        self.bill_total_frame = ttk.Frame(bill_frame)
-        self.bill_total_frame.pack(anchor=tk.W)
-        
         # Initial total calculation
-        self.update_bill_total(bill_frame, duration_hours, service_cost)
-        
-        # Buttons
-        button_frame = ttk.Frame(bill_frame)
-        button_frame.pack(pady=20)
-        
-        ttk.Button(button_frame, text="Save to Database", 
-                  command=lambda: self.save_bill_to_database(ps_name, duration, service_cost, bill_window)).pack(side=tk.LEFT, padx=5)
+        self.update_bill_total()
         
-        ttk.Button(button_frame, text="Close Without Saving", 
-                  command=lambda: self.close_session(ps_name, bill_window)).pack(side=tk.LEFT, padx=5)
+        self.bill_window.deiconify()
+        self.bill_window.lift()
 
-    def update_bill_total(self, bill_frame, duration_hours, service_cost):
+    def update_bill_total(self):
         """Update the total cost based on offer selection"""
-        # Clear previous total display
-        for widget in self.bill_total_frame.winfo_children():
-            widget.destroy()
-        
         # Calculate PlayStation cost based on offer selection
         if self.apply_offer_var.get():
             ps_cost = self.current_offer["offer_cost"]
             savings = self.current_offer["savings"]
             
-            ttk.Label(self.bill_total_frame, text=f"PlayStation Cost: ${int(ps_cost):,} (with offer)", 
-                     font=("Arial", 12, "bold"), foreground="green").pack(anchor=tk.W)
+            self.bill_ps_label.configure(text=f"PlayStation Cost: ${format_money(ps_cost)} (with offer)", 
+                                         foreground="green")
             if savings > 0:
-                ttk.Label(self.bill_total_frame, text=f"Savings Applied: ${int(savings):,}", 
-                         font=("Arial", 10), foreground="red").pack(anchor=tk.W)
+                self.bill_savings_label.configure(text=f"Savings Applied: ${format_money(savings)}")
+                self.bill_savings_label.pack(anchor=tk.W, before=self.bill_total_label)
+            else:
+                self.bill_savings_label.pack_forget()
         else:
             ps_cost = self.current_offer["normal_cost"]
-            ttk.Label(self.bill_total_frame, text=f"PlayStation Cost: ${int(ps_cost):,} (normal rate)", 
-                     font=("Arial", 12, "bold")).pack(anchor=tk.W)
+            self.bill_ps_label.configure(text=f"PlayStation Cost: ${format_money(ps_cost)} (normal rate)", 
+                                         foreground="")
+            self.bill_savings_label.pack_forget()
         
         # Calculate and display total
-        total_cost = ps_cost + service_cost
-        ttk.Label(self.bill_total_frame, text=f"TOTAL: ${int(total_cost):,}", 
-                 font=("Arial", 14, "bold")).pack(anchor=tk.W, pady=(10, 0))
+        total_cost = ps_cost + self.bill_service_cost
+        self.bill_total_label.configure(text=f"TOTAL: ${format_money(total_cost)}")
 
     def save_bill_to_database(self, ps_name, duration, service_cost, bill_window):
-        """Save session data to Excel database with offer applied"""
+        """Save session data to database with offer applied"""
         # Calculate final PlayStation cost based on offer selection
         if self.apply_offer_var.get():
             ps_cost = self.current_offer["offer_cost"]
@@ -694,14 +1229,11 @@ class GamingLoungeManager:
         
         # Confirmation dialog
         result = messagebox.askyesno("Confirm Save", 
-                                    f"Save this session to database?\n\nTotal: ${int(total_cost):,}")
+                                    f"Save this session to database?\n\nTotal: ${format_money(total_cost)}")
         if not result:
             return
         
         try:
-            # Read existing data
-            df = pd.read_excel(self.db_file)
-            
             # Prepare services string
             services_str = ", ".join([f"{s['name']}(${int(s['price']):,})" for s in self.sessions[ps_name]["services"]])
             if not services_str:
@@ -712,129 +1244,194 @@ class GamingLoungeManager:
             minutes = int((duration % 3600) // 60)
             duration_formatted = f"{hours:02d}:{minutes:02d}"
             
+            # Date and time from a single clock read
+            date_str, time_str = datetime.now().isoformat(sep=' ', timespec='seconds').split(' ')
+            
             # Create new row
             new_row = {
-                'Date': datetime.now().strftime('%Y-%m-%d'),
-                'Time': datetime.now().strftime('%H:%M:%S'),
+                'Date': date_str,
+                'Time': time_str,
                 'PlayStation': ps_name,
                 'Customer': "N/A",
                 'Duration_Hours': duration_formatted,
-                'PS_Cost': round(ps_cost, 2),
+                'PS_Cost': ps_cost / 100,
                 'Services': services_str,
-                'Service_Cost': round(service_cost, 2),
-                'Total_Cost': round(total_cost, 2)
+                'Service_Cost': service_cost / 100,
+                'Total_Cost': total_cost / 100
             }
             
-            # Add to dataframe
-            df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
-            
-            # Save to Excel
-            df.to_excel(self.db_file, index=False)
+            # Append to database
+            self.append_to_database(new_row)
             
             messagebox.showinfo("Success", "Session saved to database!")
             self.close_session(ps_name, bill_window)
             
             # Auto-refresh database tab if it exists
             if hasattr(self, 'tree'):
-                self.refresh_database()
+                self.refresh_database(silent=True)
         
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save to database: {str(e)}")
     
     def close_session(self, ps_name, bill_window):
         """Close session and reset PlayStation"""
+        self.reset_session(ps_name)
+        bill_window.withdraw()
+    
+    def reset_session(self, ps_name):
+        """Reset PlayStation session and its controls to available"""
         # Reset session
         self.sessions[ps_name] = {
             "active": False,
             "start_time": None,
             "customer_name": "",
-            "services": []
+            "services": [],
+            "services_cents": 0
         }
-        
-        # Reset UI
-        self.ps_frames[ps_name]["status_label"].config(text="Available", foreground="green")
-        self.ps_frames[ps_name]["timer_label"].config(text="00:00:00")
-        self.ps_frames[ps_name]["apply_btn"].config(state="normal")
-        self.ps_frames[ps_name]["services_listbox"].delete(0, tk.END)
-        
-        bill_window.destroy()
+        self.sync_session(ps_name)
+        
+        # Reset UI, one call per widget, skipping widgets already showing the reset state
+        ps_frame = self.ps_frames[ps_name]
+        i = self._ps_index[ps_name]
+        ps_frame["status_label"].configure(style="Available.TLabel", text="Available")
+        ps_frame["apply_btn"].configure(state="normal")
+        
+        if self._last_timer_text[i] != "00:00:00":
+            ps_frame["timer_label"].configure(text="00:00:00")
+            self._last_timer_text[i] = "00:00:00"
+        if self._last_cost_text[i] != "Cost: $0":
+            ps_frame["cost_label"].configure(text="Cost: $0")
+            self._last_cost_text[i] = "Cost: $0"
+        if self._shown_services[ps_name]:
+            ps_frame["services_listbox"].delete(0, tk.END)
+            self._shown_services[ps_name] = []
     
     def download_excel(self):
-        """Download Excel database file"""
+        """Export database to an Excel file"""
         # Confirmation dialog
         result = messagebox.askyesno("Confirm Export", "Export database to Excel file?")
         if not result:
             return
         
+        # Check the source before asking where to save
+        try:
+            os.stat(self.db_file)
+        except FileNotFoundError:
+            messagebox.showwarning("Warning", "No database file found!")
+            return
+        
         try:
-            if not os.path.exists(self.db_file):
-                messagebox.showwarning("Warning", "No database file found!")
-                return
-            
             # Ask user where to save
             file_path = filedialog.asksaveasfilename(
                 defaultextension=".xlsx",
-                filetypes=[("Excel files", "*.xlsx"), ("All files", "*.*")],
+                filetypes=[("Excel files", "*.xlsx"), ("CSV files", "*.csv"), ("All files", "*.*")],
                 title="Save Gaming Lounge Database"
             )
             
             if file_path:
-                # Ensure .xlsx extension
-                if not file_path.endswith('.xlsx'):
-                    file_path += '.xlsx'
-                
-                # Copy database file to chosen location
-                df = pd.read_excel(self.db_file)
-                df.to_excel(file_path, index=False)
+                if file_path.endswith('.csv'):
+                    # The database is already a CSV file, so just copy it
+                    self.flush_database()
+                    shutil.copyfile(self.db_file, file_path)
+                else:
+                    # Ensure .xlsx extension
+                    if not file_path.endswith('.xlsx'):
+                        file_path += '.xlsx'
+                    
+                    # Convert database to Excel at chosen location
+                    self.export_database_xlsx(file_path)
                 messagebox.showinfo("Success", f"Database exported to:\n{file_path}")
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to export database: {str(e)}")
 
+    def export_database_xlsx(self, file_path):
+        """Write all database records to an Excel file"""
+        self.flush_database()
+        rows = [[(float(record[col]) if record[col] else None) if col in DB_MONEY_COLUMNS
+                 else record[col] for col in DB_COLUMNS] for record in self.load_database()]
+        
+        # pyexcelerate writes large sheets several times faster than openpyxl
+        try:
+            from pyexcelerate import Workbook
+        except ImportError:
+            Workbook = None
+        
+        if Workbook is not None:
+            workbook = Workbook()
+            workbook.new_sheet("Sheet1", data=[DB_COLUMNS] + rows)
+            workbook.save(file_path)
+            return
+        
+        from openpyxl import Workbook
+        
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet()
+        sheet.append(DB_COLUMNS)
+        for row in rows:
+            sheet.append(row)
+        workbook.save(file_path)
+
     def update_timer(self):
-        for ps_name, session in self.sessions.items():
-            if session["active"]:
-                duration = time.time() - session["start_time"]
-                hours = int(duration // 3600)
-                minutes = int((duration % 3600) // 60)
-                seconds = int(duration % 60)
-                
-                timer_text = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-                self.ps_frames[ps_name]["timer_label"].config(text=timer_text)
-                
-                # Calculate PlayStation cost with offers
-                duration_hours = duration / 3600
-                current_ps_cost = self.calculate_ps_cost(duration_hours)
-                
-                # Add services cost
-                services_cost = sum(service["price"] for service in session["services"])
-                total_current_cost = current_ps_cost + services_cost
-                
-                # Format cost with commas and no decimals
-                cost_formatted = f"{int(total_current_cost):,}"
-                self.ps_frames[ps_name]["cost_label"].config(text=f"Cost: ${cost_formatted}")
-            else:
-                # Reset cost when not active
-                self.ps_frames[ps_name]["cost_label"].config(text="Cost: $0")
+        """Refresh timer and cost labels of active PlayStations"""
+        # Nothing to show while the lounge is idle; start_session restarts the timer
+        if not any(self._active):
+            self.timer_job = None
+            return
         
-        self.root.after(1000, self.update_timer)
+        now = time.time()
+        
+        last_timer_text = self._last_timer_text
+        last_cost_text = self._last_cost_text
+        svc_total = self._svc_total
+        rate_tiers = self.rate_tiers
+        
+        for i, (active, start) in enumerate(zip(self._active, self._start)):
+            if not active:
+                continue
+            
+            duration = now - start
+            hours = int(duration // 3600)
+            minutes = int((duration % 3600) // 60)
+            seconds = int(duration % 60)
+            
+            # Only touch the label when the displayed text changes
+            timer_text = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+            if timer_text != last_timer_text[i]:
+                self._timer_labels[i].config(text=timer_text)
+                last_timer_text[i] = timer_text
+            
+            # Calculate PlayStation cost with offers (whole minutes, cached)
+            current_ps_cost = self.ps_cost_for_minutes(int(duration // 60), rate_tiers)
+            
+            # Add services cost
+            total_current_cost = current_ps_cost + svc_total[i]
+            
+            # Format cost with commas and no decimals
+            cost_text = f"Cost: ${format_money(total_current_cost)}"
+            if cost_text != last_cost_text[i]:
+                self._cost_labels[i].config(text=cost_text)
+                last_cost_text[i] = cost_text
+        
+        # Schedule the next tick on the next whole second so it doesn't drift
+        self.timer_job = self.root.after(max(1, 1000 - int(now * 1000) % 1000), self.update_timer)
 
-    def calculate_ps_cost(self, duration_hours):
-        """Calculate PlayStation cost with offers applied"""
-        if not self.config["offers"]["enabled"]:
-            return duration_hours * self.config["playstation_rate"]
-        
-        base_rate = self.config["playstation_rate"]
-        
-        if duration_hours >= 3:
-            # 3+ hours: all hours at 4666 rate
-            return duration_hours * self.config["offers"]["3_hour_rate"]
-        elif duration_hours >= 2:
-            # 2+ hours: all hours at 5000 rate
-            return duration_hours * self.config["offers"]["2_hour_rate"]
-        else:
-            # Less than 2 hours: normal rate
-            return duration_hours * base_rate
+    def calculate_ps_cost(self, duration):
+        """Calculate PlayStation cost in cents for a duration in seconds, with offers applied"""
+        return self.cost_for_seconds(int(duration), self.rate_tiers)
+
+    @staticmethod
+    def cost_for_seconds(seconds, rate_tiers):
+        """PlayStation cost in cents for whole seconds, at the rate of the longest tier reached"""
+        for threshold, rate in rate_tiers:
+            if seconds >= threshold:
+                return seconds * rate // 3600
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def ps_cost_for_minutes(minutes, rate_tiers):
+        """Cached PlayStation cost in cents for whole minutes, used by the live timer"""
+        return GamingLoungeManager.cost_for_seconds(minutes * 60, rate_tiers)
 
     def setup_database_tab(self):
         """Setup the live database viewer tab"""
@@ -847,7 +1444,7 @@ class GamingLoungeManager:
         header_frame.pack(fill=tk.X, pady=(0, 10))
         
         ttk.Label(header_frame, text="Database Viewer", 
-                 font=("Arial", 16, "bold")).pack(side=tk.LEFT)
+                 font=self._font_bold_16).pack(side=tk.LEFT)
         
         # Date selection frame
         date_frame = ttk.Frame(header_frame)
@@ -904,11 +1501,11 @@ class GamingLoungeManager:
         summary_info_frame.pack(fill=tk.X)
         
         self.summary_date_label = ttk.Label(summary_info_frame, text="Date: Today", 
-                                           font=("Arial", 12, "bold"))
+                                           font=self._font_bold_12)
         self.summary_date_label.pack(side=tk.LEFT)
         
         self.summary_total_label = ttk.Label(summary_info_frame, text="Total Revenue: $0.00", 
-                                            font=("Arial", 12, "bold"), foreground="green")
+                                            font=self._font_bold_12, foreground="green")
         self.summary_total_label.pack(side=tk.RIGHT)
         
         # Breakdown frame
@@ -925,41 +1522,30 @@ class GamingLoungeManager:
         self.summary_sessions_label.pack(side=tk.RIGHT)
         
         # Treeview for data display
-        columns = ['Date', 'Time', 'PlayStation', 'Customer', 'Duration_Hours', 
-                   'PS_Cost', 'Services', 'Service_Cost', 'Total_Cost']
-        
-        self.tree = ttk.Treeview(db_frame, columns=columns, show='headings', height=20)
+        self.tree = ttk.Treeview(db_frame, columns=DB_COLUMNS, show='headings', height=20)
         
         # Configure columns
-        for col in columns:
-            if col == 'Duration_Hours':
-                self.tree.heading(col, text='Duration (HH:MM)')
-            else:
-                self.tree.heading(col, text=col.replace('_', ' '))
-            
-            if col in ['PS_Cost', 'Service_Cost', 'Total_Cost']:
-                self.tree.column(col, width=80, anchor='center')
-            elif col in ['Date', 'Time']:
-                self.tree.column(col, width=100, anchor='center')
-            elif col == 'PlayStation':
-                self.tree.column(col, width=80, anchor='center')
-            elif col == 'Duration_Hours':
-                self.tree.column(col, width=100, anchor='center')
-            else:
-                self.tree.column(col, width=120)
+        for col in DB_COLUMNS:
+            width, anchor, heading = self._COL_CFG.get(col, (120, 'w', col.replace('_', ' ')))
+            self.tree.heading(col, text=heading)
+            self.tree.column(col, width=width, anchor=anchor)
         
         # Scrollbars
-        v_scrollbar = ttk.Scrollbar(db_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self.db_v_scrollbar = ttk.Scrollbar(db_frame, orient=tk.VERTICAL, command=self.tree.yview)
         h_scrollbar = ttk.Scrollbar(db_frame, orient=tk.HORIZONTAL, command=self.tree.xview)
-        self.tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self.tree.configure(yscrollcommand=self.on_database_scroll, xscrollcommand=h_scrollbar.set)
         
         # Pack treeview and scrollbars
         self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.db_v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
         
+        # Records matching the current view, added to the tree a page at a time
+        self.db_view_records = []
+        self.db_view_count = 0
+        
         # Load initial data (today's data)
-        self.refresh_database()
+        self.refresh_database(silent=True)
 
     def load_date_data(self):
         """Load data for selected date"""
@@ -975,53 +1561,86 @@ class GamingLoungeManager:
         """Show all data regardless of date"""
         self.refresh_database(show_all=True)
 
-    def refresh_database(self, filter_date=None, show_all=False):
-        """Refresh the database view with optional date filtering"""
+    def refresh_database(self, filter_date=None, show_all=False, silent=False):
+        """Refresh the database view with optional date filtering (silent skips the success message)"""
         try:
-            # Clear existing data
-            for item in self.tree.get_children():
-                self.tree.delete(item)
+            # Clear existing data in one call
+            self.tree.delete(*self.tree.get_children())
             
-            # Load data from Excel
-            if os.path.exists(self.db_file):
-                df = pd.read_excel(self.db_file)
-                
-                # Filter by date if specified
-                if filter_date and not show_all:
-                    df_filtered = df[df['Date'] == filter_date]
-                    display_date = filter_date
-                elif not show_all:
-                    # Default to today's date
-                    today = datetime.now().strftime('%Y-%m-%d')
-                    df_filtered = df[df['Date'] == today]
-                    display_date = today
-                else:
-                    # Show all data
-                    df_filtered = df
-                    display_date = "All Dates"
-                
-                # Insert filtered data into treeview
-                for index, row in df_filtered.iterrows():
-                    values = [str(row[col]) if pd.notna(row[col]) else "" for col in df.columns]
-                    self.tree.insert("", tk.END, values=values)
-                
-                # Update summary
-                self.update_daily_summary(df_filtered, display_date)
-                
-                if not show_all:
-                    messagebox.showinfo("Success", f"Database refreshed for {display_date}!")
-                else:
-                    messagebox.showinfo("Success", "Database refreshed - showing all data!")
-            else:
+            # Load data from database
+            try:
+                records = self.load_database()
+            except FileNotFoundError:
                 # Reset summary if no data
-                self.update_daily_summary(pd.DataFrame(), "No Data")
+                self.db_view_records = []
+                self.db_view_count = 0
+                self.update_daily_summary(None, "No Data")
+                return
+            
+            # Filter by date if specified (records keep their row position, used for deletion)
+            if filter_date and not show_all:
+                records_filtered = self._db_by_date.get(filter_date, [])
+                totals = self._totals_by_date.get(filter_date)
+                display_date = filter_date
+            elif not show_all:
+                # Default to today's date
+                records_filtered = self._db_by_date.get(self._today, [])
+                totals = self._totals_by_date.get(self._today)
+                display_date = self._today
+            else:
+                # Show all data
+                records_filtered = list(enumerate(records))
+                totals = [sum(column) for column in zip(*self._totals_by_date.values())] or None
+                display_date = "All Dates"
+            
+            # Insert the first page of filtered data into treeview
+            self.db_view_records = records_filtered
+            self.db_view_count = 0
+            self.load_more_database_rows()
+            
+            # Update summary
+            self.update_daily_summary(totals, display_date)
+            
+            if silent:
+                return
+            
+            if not show_all:
+                messagebox.showinfo("Success", f"Database refreshed for {display_date}!")
+            else:
+                messagebox.showinfo("Success", "Database refreshed - showing all data!")
         
         except Exception as e:
             messagebox.showerror("Error", f"Failed to refresh database: {str(e)}")
 
-    def update_daily_summary(self, df, display_date):
-        """Update the daily summary section"""
-        if df.empty:
+    def update_today(self):
+        """Cache today's date and schedule the next update just after midnight"""
+        now = datetime.now()
+        self._today = now.strftime('%Y-%m-%d')
+        
+        midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        self.root.after(int((midnight - now).total_seconds() * 1000) + 1000, self.update_today)
+
+    def load_more_database_rows(self):
+        """Add the next page of the current view to the treeview"""
+        end = self.db_view_count + DB_PAGE_SIZE
+        page = [(str(index), record_values(record))
+                for index, record in self.db_view_records[self.db_view_count:end]]
+        
+        # Local binding for the loop
+        insert = self.tree.insert
+        for iid, values in page:
+            insert("", tk.END, iid=iid, values=values)
+        self.db_view_count = min(end, len(self.db_view_records))
+
+    def on_database_scroll(self, first, last):
+        """Update the scrollbar and load more rows once the end is reached"""
+        self.db_v_scrollbar.set(first, last)
+        if float(last) >= 1.0 and self.db_view_count < len(self.db_view_records):
+            self.load_more_database_rows()
+
+    def update_daily_summary(self, totals, display_date):
+        """Update the daily summary section from [total, PlayStation, services, sessions] totals"""
+        if not totals:
             self.summary_date_label.config(text=f"Date: {display_date}")
             self.summary_total_label.config(text="Total Revenue: $0")
             self.summary_ps_label.config(text="PlayStation: $0")
@@ -1029,11 +1648,8 @@ class GamingLoungeManager:
             self.summary_sessions_label.config(text="Sessions: 0")
             return
         
-        # Calculate totals
-        total_revenue = df['Total_Cost'].sum() if 'Total_Cost' in df.columns else 0
-        ps_revenue = df['PS_Cost'].sum() if 'PS_Cost' in df.columns else 0
-        services_revenue = df['Service_Cost'].sum() if 'Service_Cost' in df.columns else 0
-        total_sessions = len(df)
+        # Totals are kept up to date as records are loaded and saved
+        total_revenue, ps_revenue, services_revenue, total_sessions = totals
         
         # Format numbers without decimals and with commas
         total_formatted = f"{int(total_revenue):,}"
@@ -1063,20 +1679,19 @@ class GamingLoungeManager:
             return
         
         try:
-            # Get the index of selected item
-            item_index = self.tree.index(selected_item[0])
+            # Get the database row of selected item
+            record_index = int(selected_item[0])
             
-            # Load dataframe
-            df = pd.read_excel(self.db_file)
+            # Copy the records so the cache stays intact if saving fails
+            self.flush_database()
+            records = list(self.load_database())
             
-            # Remove the row
-            df = df.drop(df.index[item_index]).reset_index(drop=True)
-            
-            # Save back to Excel
-            df.to_excel(self.db_file, index=False)
+            # Remove the row and save back
+            del records[record_index]
+            self.rewrite_database(records)
             
             # Refresh the view
-            self.refresh_database()
+            self.refresh_database(silent=True)
             
             messagebox.showinfo("Success", "Record deleted successfully!")
             
@@ -1085,28 +1700,53 @@ class GamingLoungeManager:
 
     def add_service_only(self, service):
         """Add service to current services-only order"""
+        price = self.config["services"][service]
+        confirm = self.config["ui"]["confirm_service_add"]
+        
         # Show confirmation dialog
-        result = messagebox.askyesno("Confirm Service", 
-                                   f"Add {service.title()} (${self.config['services'][service]}) to current order?")
+        if confirm:
+            result = messagebox.askyesno("Confirm Service", 
+                                       f"Add {self.service_display[service]} (${price}) to current order?")
+            if not result:
+                return
         
-        if result:
-            service_entry = {
-                "name": service,
-                "price": self.config["services"][service],
-                "time": datetime.now().strftime("%H:%M:%S")
-            }
-            
-            self.services_only_list.append(service_entry)
-            self.update_current_order_display()
-            messagebox.showinfo("Success", f"{service.title()} added to current order")
+        service_entry = {
+            "name": service,
+            "price": price,
+            "time": datetime.now().strftime("%H:%M:%S")
+        }
+        
+        self.services_only_list.append(service_entry)
+        self.services_only_total += price
+        self.update_current_order_display()
+        
+        message = f"{self.service_display[service]} added to current order"
+        if confirm:
+            messagebox.showinfo("Success", message)
+        else:
+            self.show_status(message, undo=lambda: self.undo_add_service_only(service_entry))
+    
+    def undo_add_service_only(self, service_entry):
+        """Take back a services-only item added in quick add mode"""
+        for index, entry in enumerate(self.services_only_list):
+            if entry is service_entry:
+                del self.services_only_list[index]
+                self.services_only_total -= service_entry["price"]
+                self.update_current_order_display()
+                break
 
     def update_current_order_display(self):
         """Update the current order listbox display"""
         self.current_order_listbox.delete(0, tk.END)
         
+        # Local bindings for the loop
+        insert = self.current_order_listbox.insert
+        end = tk.END
+        fmt = "{} - ${} ({})".format
+        display = self.service_display
+        
         for service in self.services_only_list:
-            display_text = f"{service['name'].title()} - ${service['price']} ({service['time']})"
-            self.current_order_listbox.insert(tk.END, display_text)
+            insert(end, fmt(display[service['name']], service['price'], service['time']))
 
     def add_to_pending_orders(self):
         """Add current order to pending orders"""
@@ -1120,7 +1760,7 @@ class GamingLoungeManager:
             return
         
         # Calculate total
-        total_cost = sum(service["price"] for service in self.services_only_list)
+        total_cost = self.services_only_total
         
         # Confirmation dialog
         result = messagebox.askyesno("Confirm Add to Pending", 
@@ -1136,31 +1776,31 @@ class GamingLoungeManager:
             }
             
             self.pending_orders.append(pending_order)
-            self.update_pending_orders_display()
+            self.insert_pending_order(pending_order)
             
             # Clear current order
             self.services_only_list.clear()
+            self.services_only_total = 0.0
             self.services_customer_var.set("")
             self.update_current_order_display()
             
             messagebox.showinfo("Success", f"Order for {customer_name} added to pending orders")
 
-    def update_pending_orders_display(self):
-        """Update the pending orders treeview"""
-        # Clear existing items
-        for item in self.pending_tree.get_children():
-            self.pending_tree.delete(item)
-        
-        # Add pending orders
-        for order in self.pending_orders:
-            services_text = ", ".join([f"{s['name'].title()}(${s['price']})" for s in order["services"]])
-            values = [
-                order["customer"],
-                services_text,
-                f"${order['total']:.2f}",
-                order["time_added"]
-            ]
-            self.pending_tree.insert("", tk.END, values=values)
+    def insert_pending_order(self, order):
+        """Add a pending order row to the treeview"""
+        display = self.service_display
+        services_text = ", ".join([f"{display[s['name']]}(${s['price']})" for s in order["services"]])
+        values = (
+            order["customer"],
+            services_text,
+            f"${order['total']:.2f}",
+            order["time_added"]
+        )
+        
+        # Stable row id so later changes only touch this row
+        self.pending_iid_counter += 1
+        order["iid"] = f"order{self.pending_iid_counter}"
+        self.pending_tree.insert("", tk.END, iid=order["iid"], values=values)
 
     def generate_bill_for_pending(self):
         """Generate bill for selected pending order"""
@@ -1179,9 +1819,9 @@ class GamingLoungeManager:
                                    f"Generate bill for {order['customer']}?\n\nTotal: ${order['total']:.2f}")
         
         if result:
-            self.show_pending_services_bill(order, item_index)
+            self.show_pending_services_bill(order)
 
-    def show_pending_services_bill(self, order, order_index):
+    def show_pending_services_bill(self, order):
         """Show bill for pending services order"""
         bill_window = tk.Toplevel(self.root)
         bill_window.title("Services Bill")
@@ -1192,7 +1832,7 @@ class GamingLoungeManager:
         bill_frame.pack(fill=tk.BOTH, expand=True)
         
         ttk.Label(bill_frame, text="SERVICES BILL", 
-                 font=("Arial", 16, "bold")).pack(pady=(0, 20))
+                 font=self._font_bold_16).pack(pady=(0, 20))
         
         ttk.Label(bill_frame, text=f"Customer: {order['customer']}").pack(anchor=tk.W)
         ttk.Label(bill_frame, text=f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M')}").pack(anchor=tk.W)
@@ -1201,45 +1841,52 @@ class GamingLoungeManager:
         ttk.Separator(bill_frame, orient='horizontal').pack(fill=tk.X, pady=10)
         
         # Services
-        ttk.Label(bill_frame, text="Services Ordered:", font=("Arial", 12, "bold")).pack(anchor=tk.W)
+        ttk.Label(bill_frame, text="Services Ordered:", font=self._font_bold_12).pack(anchor=tk.W)
         
         for service in order["services"]:
-            ttk.Label(bill_frame, text=f"• {service['name'].title()}: ${service['price']} ({service['time']})").pack(anchor=tk.W)
+            ttk.Label(bill_frame, text=f"• {self.service_display[service['name']]}: ${service['price']} ({service['time']})").pack(anchor=tk.W)
         
         ttk.Separator(bill_frame, orient='horizontal').pack(fill=tk.X, pady=10)
         
         # Total
         ttk.Label(bill_frame, text=f"TOTAL: ${order['total']:.2f}", 
-                 font=("Arial", 14, "bold")).pack(anchor=tk.W)
+                 font=self._font_bold_14).pack(anchor=tk.W)
         
         # Buttons
         button_frame = ttk.Frame(bill_frame)
         button_frame.pack(pady=20)
         
         ttk.Button(button_frame, text="Save & Complete Order", 
-                  command=lambda: self.save_pending_to_database(order, order_index, bill_window)).pack(side=tk.LEFT, padx=5)
+                  command=lambda: self.save_pending_to_database(order, bill_window)).pack(side=tk.LEFT, padx=5)
         
         ttk.Button(button_frame, text="Close Without Saving", 
                   command=bill_window.destroy).pack(side=tk.LEFT, padx=5)
 
-    def save_pending_to_database(self, order, order_index, bill_window):
+    def save_pending_to_database(self, order, bill_window):
         """Save pending order to database and remove from pending"""
         result = messagebox.askyesno("Confirm Save", 
                                    f"Save and complete order for {order['customer']}?\n\nTotal: ${order['total']:.2f}")
         if not result:
             return
         
+        # The bill window doesn't block the pending list, so find the order as it is now
+        order_index = next((i for i, o in enumerate(self.pending_orders) if o is order), None)
+        if order_index is None:
+            messagebox.showwarning("Warning", "This order is no longer pending")
+            bill_window.destroy()
+            return
+        
         try:
-            # Read existing data
-            df = pd.read_excel(self.db_file)
-            
             # Prepare services string
             services_str = ", ".join([f"{s['name']}(${s['price']})" for s in order["services"]])
             
+            # Date and time from a single clock read
+            date_str, time_str = datetime.now().isoformat(sep=' ', timespec='seconds').split(' ')
+            
             # Create new row
             new_row = {
-                'Date': datetime.now().strftime('%Y-%m-%d'),
-                'Time': datetime.now().strftime('%H:%M:%S'),
+                'Date': date_str,
+                'Time': time_str,
                 'PlayStation': "Services Only",
                 'Customer': order["customer"],
                 'Duration_Hours': "00:00",
@@ -1249,22 +1896,19 @@ class GamingLoungeManager:
                 'Total_Cost': round(order["total"], 2)
             }
             
-            # Add to dataframe
-            df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
-            
-            # Save to Excel
-            df.to_excel(self.db_file, index=False)
+            # Append to database
+            self.append_to_database(new_row)
             
             # Remove from pending orders
-            del self.pending_orders[item_index]
-            self.update_pending_orders_display()
+            del self.pending_orders[order_index]
+            self.pending_tree.delete(order["iid"])
             
             messagebox.showinfo("Success", f"Order for {order['customer']} completed and saved!")
             bill_window.destroy()
             
             # Auto-refresh database tab if it exists
             if hasattr(self, 'tree'):
-                self.refresh_database()
+                self.refresh_database(silent=True)
         
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save order: {str(e)}")
@@ -1286,7 +1930,7 @@ class GamingLoungeManager:
         
         if result:
             del self.pending_orders[item_index]
-            self.update_pending_orders_display()
+            self.pending_tree.delete(order["iid"])
             messagebox.showinfo("Success", "Pending order removed")
 
     def add_more_services_to_pending(self):
@@ -1303,12 +1947,13 @@ class GamingLoungeManager:
         
         # Load order into current order for editing
         self.services_only_list = order["services"].copy()
+        self.services_only_total = order["total"]
         self.services_customer_var.set(order["customer"])
         self.update_current_order_display()
         
         # Remove from pending (will be re-added when "Add to Pending" is clicked)
         del self.pending_orders[item_index]
-        self.update_pending_orders_display()
+        self.pending_tree.delete(order["iid"])
         
         messagebox.showinfo("Info", f"Order for {order['customer']} loaded for editing.\nAdd more services and click 'Add to Pending Orders' when done.")
 
@@ -1323,12 +1968,26 @@ class GamingLoungeManager:
         index = selection[0]
         service_name = self.services_only_list[index]["name"]
         
-        result = messagebox.askyesno("Confirm Removal", 
-                                   f"Remove {service_name.title()} from current order?")
+        confirm = self.config["ui"]["confirm_service_add"]
+        if confirm:
+            result = messagebox.askyesno("Confirm Removal", 
+                                       f"Remove {self.service_display[service_name]} from current order?")
+            if not result:
+                return
         
-        if result:
-            del self.services_only_list[index]
-            self.update_current_order_display()
+        service_entry = self.services_only_list.pop(index)
+        self.services_only_total -= service_entry["price"]
+        self.update_current_order_display()
+        
+        if not confirm:
+            self.show_status(f"{self.service_display[service_name]} removed from current order",
+                             undo=lambda: self.undo_remove_service_only(index, service_entry))
+    
+    def undo_remove_service_only(self, index, service_entry):
+        """Put back a services-only item removed in quick add mode"""
+        self.services_only_list.insert(index, service_entry)
+        self.services_only_total += service_entry["price"]
+        self.update_current_order_display()
 
     def clear_current_order(self):
         """Clear current order"""
@@ -1336,13 +1995,90 @@ class GamingLoungeManager:
             messagebox.showinfo("Info", "No services in current order")
             return
         
-        result = messagebox.askyesno("Confirm Clear", "Clear current order?")
+        confirm = self.config["ui"]["confirm_service_add"]
+        if confirm:
+            result = messagebox.askyesno("Confirm Clear", "Clear current order?")
+            if not result:
+                return
+        
+        # Kept for undo
+        cleared = (list(self.services_only_list), self.services_only_total, self.services_customer_var.get())
         
-        if result:
-            self.services_only_list.clear()
-            self.services_customer_var.set("")
-            self.update_current_order_display()
+        self.services_only_list.clear()
+        self.services_only_total = 0.0
+        self.services_customer_var.set("")
+        self.update_current_order_display()
+        
+        if confirm:
             messagebox.showinfo("Success", "Current order cleared")
+        else:
+            self.show_status("Current order cleared", undo=lambda: self.undo_clear_current_order(*cleared))
+    
+    def undo_clear_current_order(self, services, total, customer):
+        """Restore a current order cleared in quick add mode, if nothing was added since"""
+        if self.services_only_list:
+            return
+        
+        self.services_only_list.extend(services)
+        self.services_only_total = total
+        self.services_customer_var.set(customer)
+        self.update_current_order_display()
+
+    def show_status(self, message, undo=None):
+        """Show a message in the status bar for a few seconds, optionally with Undo"""
+        if self.status_job is not None:
+            self.root.after_cancel(self.status_job)
+        
+        self.status_label.config(text=message)
+        self.undo_action = undo
+        if undo is None:
+            self.undo_btn.pack_forget()
+        else:
+            self.undo_btn.pack(side=tk.LEFT, padx=5)
+        
+        self.status_job = self.root.after(STATUS_TIMEOUT_MS, self.clear_status)
+
+    def clear_status(self):
+        """Clear the status bar"""
+        if self.status_job is not None:
+            self.root.after_cancel(self.status_job)
+            self.status_job = None
+        
+        self.status_label.config(text="")
+        self.undo_action = None
+        self.undo_btn.pack_forget()
+
+    def undo_last_action(self):
+        """Undo the action shown in the status bar"""
+        undo = self.undo_action
+        self.clear_status()
+        if undo is not None:
+            undo()
+
+    def on_close(self):
+        """Finish pending database writes, close the file and exit"""
+        self._db_queue.put(None)
+        self._db_thread.join(timeout=2)
+        
+        with self._db_lock:
+            self._db_fp.close()
+            error = self._db_error
+            unsaved = list(self._db_failed)
+        
+        # Records the writer didn't get to before the timeout
+        if self._db_thread.is_alive():
+            while True:
+                try:
+                    record = self._db_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if record is not None:
+                    unsaved.append(record)
+        
+        if unsaved or error is not None or self._db_thread.is_alive():
+            messagebox.showerror("Error", f"Some records could not be saved to the database: "
+                                          f"{str(error or 'writing did not finish')}\n\n{self.describe_records(unsaved)}")
+        self.root.destroy()
 
     def run(self):
         """Start the application"""